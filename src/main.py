@@ -39,6 +39,9 @@ def main():
         print("📝 Generating report...")
         report_path = report_generator.generate_report(scraped_data)
         
+        # Only skip these posts in later runs once they're in a report
+        scraper.commit_seen()
+        
         print(f"✅ Report generated successfully!")
         print(f"   📁 Saved to: {report_path}")
         
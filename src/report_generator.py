@@ -1,3 +1,4 @@
+import io
 import os
 from datetime import datetime
 from typing import Dict, List, Any
@@ -30,58 +31,52 @@ class ReportGenerator:
         filename = f"competitive_intel_{today.strftime('%Y%m%d_%H%M%S')}.md"
         filepath = os.path.join(self.reports_dir, filename)
         
-        with open(filepath, 'w', encoding='utf-8') as f:
-            f.write(report_content)
+        # Encode once and write bytes rather than going through a text wrapper
+        data = report_content.encode('utf-8')
+        with open(filepath, 'wb', buffering=1024 * 1024) as f:
+            f.write(data)
         
         return filepath
     
     def _build_report_content(self, scraped_data: Dict[str, List[Dict[str, Any]]], date: datetime) -> str:
         """Build the markdown content for the report."""
-        content = []
+        buf = io.StringIO()
         
         # Header with today's date
-        content.append(f"# AI Competitive Intelligence Report")
-        content.append(f"**Generated on:** {date.strftime('%B %d, %Y at %I:%M %p')}")
-        content.append("")
+        buf.write("# AI Competitive Intelligence Report\n"
+                  f"**Generated on:** {date.strftime('%B %d, %Y at %I:%M %p')}\n"
+                  "\n")
         
         # Summary section
         total_posts = sum(len(posts) for posts in scraped_data.values())
-        content.append(f"## Summary")
-        content.append(f"- **Total posts analyzed:** {total_posts}")
-        content.append(f"- **Companies monitored:** {len(scraped_data)}")
-        content.append("")
+        buf.write("## Summary\n"
+                  f"- **Total posts analyzed:** {total_posts}\n"
+                  f"- **Companies monitored:** {len(scraped_data)}\n"
+                  "\n")
         
         # Company sections
         for company, posts in scraped_data.items():
-            content.append(f"## {company}")
-            content.append("")
+            buf.write(f"## {company}\n\n")
             
             if not posts:
-                content.append("*No recent posts found.*")
-                content.append("")
+                buf.write("*No recent posts found.*\n\n")
                 continue
             
-            content.append(f"**Recent posts ({len(posts)}):**")
-            content.append("")
+            buf.write(f"**Recent posts ({len(posts)}):**\n\n")
             
             for post in posts:
-                content.append(f"### {post.get('title', 'Untitled')}")
-                
-                if post.get('date'):
-                    content.append(f"**Date:** {post['date']}")
-                
-                if post.get('url'):
-                    content.append(f"**Link:** [{post['url']}]({post['url']})")
-                
-                if post.get('summary'):
-                    content.append(f"**Summary:** {post['summary']}")
-                else:
-                    content.append("**Summary:** *No summary available*")
-                
-                content.append("")
+                # One write per post instead of one per line
+                date_line = f"**Date:** {post['date']}\n" if post.get('date') else ""
+                link_line = f"**Link:** [{post['url']}]({post['url']})\n" if post.get('url') else ""
+                summary = post.get('summary') or "*No summary available*"
+                buf.write(f"### {post.get('title', 'Untitled')}\n"
+                          f"{date_line}"
+                          f"{link_line}"
+                          f"**Summary:** {summary}\n"
+                          "\n")
         
         # Footer
-        content.append("---")
-        content.append("*Report generated automatically by AI Competitive Intelligence Scraper*")
+        buf.write("---\n"
+                  "*Report generated automatically by AI Competitive Intelligence Scraper*")
         
-        return "\n".join(content)
\ No newline at end of file
+        return buf.getvalue()
@@ -6,35 +6,184 @@ This module scrapes AI company blogs to extract recent posts, titles, dates,
 and summaries for competitive intelligence reporting.
 """
 
-import requests
-from bs4 import BeautifulSoup
-from datetime import datetime, timedelta
+import asyncio
+import base64
+import functools
+import html
+import importlib.util
+import multiprocessing
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+from email.utils import parsedate_to_datetime
 import json
+import random
+import threading
 import time
 import logging
-from typing import List, Dict, Optional
+from typing import TYPE_CHECKING, Any, Callable, List, Dict, Optional, Set, Tuple
 from urllib.parse import urljoin, urlparse
 import re
 
+# requests, bs4, dateutil, aiohttp and feedparser are imported where they're
+# used, so importing this module (or a missing dependency error) stays cheap
+if TYPE_CHECKING:
+    import requests
+
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = 'lxml'
+except ImportError:
+    # Fall back to the pure-Python parser when lxml isn't installed
+    HTML_PARSER = 'html.parser'
+
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:
+    # BeautifulSoup remains the parser when selectolax isn't installed
+    LexborHTMLParser = None
+
+try:
+    import brotli  # noqa: F401
+    ACCEPT_ENCODING = 'gzip, deflate, br'
+except ImportError:
+    # Only advertise brotli when responses using it can be decoded
+    ACCEPT_ENCODING = 'gzip, deflate'
+
+try:
+    import ciso8601
+except ImportError:
+    # ISO dates are still handled by dateutil, just more slowly
+    ciso8601 = None
+
+try:
+    import orjson
+except ImportError:
+    # The stdlib json module handles the cache file without orjson
+    orjson = None
+
+# Sites with feeds are scraped as HTML when feedparser isn't installed
+HAS_FEEDPARSER = importlib.util.find_spec('feedparser') is not None
+
+# Without aiohttp sites are fetched on a thread pool with requests
+HAS_AIOHTTP = importlib.util.find_spec('aiohttp') is not None
+
+# Only these tags (and everything inside them) get built into the
+# BeautifulSoup tree. The strainer only applies at the top level, so it has to
+# cover every tag a post container can be (e.g. <li class="card">, <a
+# class="card">) as well as the list wrappers around them
+STRAINER_TAGS = ['main', 'article', 'section', 'div', 'ul', 'ol', 'li', 'a']
+
+# Single union selector covering every post container strategy
+POST_SELECTOR = ', '.join([
+    'article',
+    '[class*="post"]',
+    '[class*="article"]',
+    '[class*="story"]',
+    '[class*="entry"]',
+    '[class*="item"]',
+    '[class*="card"]'
+])
+
+# Date and summary lookups within a post, matched by the parser's selector
+# engine rather than a Python regex per class token
+DATE_SELECTOR = 'time, [class*="date" i], [class*="time" i], [class*="published" i]'
+SUMMARY_SELECTOR = '[class*="summary" i], [class*="excerpt" i], [class*="description" i]'
+
+# Defaults differing in year and month, to tell which parts of a fuzzy
+# parsed date were actually in the text
+_DATE_SENTINELS = (datetime(2000, 1, 1), datetime(2001, 2, 1))
+
+# Regexes used while extracting posts, compiled once
+_NON_EMPTY_RE = re.compile(r'.+')
+_WS_RE = re.compile(r'\s+')
+_TAG_RE = re.compile(r'<[^>]+>')
+
+# Listings fit well under this; anything past it is left unread and unparsed
+MAX_RESPONSE_BYTES = 1_048_576
+
+# BlogScraper parsers that parse worker processes run by name
+PARSE_WORKER_PARSERS = ('_parse_generic_blog', '_parse_rss')
+
+# Seen post URLs are forgotten after this long, keeping the file bounded.
+# Dated posts are well past the scrape cutoff by then
+SEEN_URL_MAX_AGE_DAYS = 30
+
+# Async fetch limits
+MAX_CONCURRENT_REQUESTS = 10
+MAX_RETRIES = 3
+MAX_RETRY_AFTER = 60  # Seconds, caps a server's Retry-After request
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
 class BlogScraper:
     """Web scraper for AI company blogs"""
     
-    def __init__(self, rate_limit_delay: float = 1.0):
+    def __init__(self, rate_limit_delay: float = 1.0, cache_path: Optional[str] = '.scrape_cache.json',
+                 seen_urls_path: Optional[str] = '.seen_urls.json'):
         """Initialize the scraper with rate limiting
         
         Args:
             rate_limit_delay: Delay between requests in seconds
+            cache_path: File persisting ETag/Last-Modified validators and page
+                bodies between runs, or None to disable conditional requests
+            seen_urls_path: File persisting the URLs of posts already
+                reported, which later runs skip, or None to return every post.
+                URLs found by a run are only recorded by commit_seen()
         """
+        import requests
+        from requests.adapters import HTTPAdapter
+        
+        # The parsers import these lazily inside their error handling, where a
+        # missing module would only be logged; fail here instead so callers
+        # (main.py) can report the missing dependency
+        import dateutil.parser  # noqa: F401
+        if LexborHTMLParser is None:
+            import bs4  # noqa: F401
+        
         self.rate_limit_delay = rate_limit_delay
+        
+        # URL -> (ETag, Last-Modified, body) from the last successful fetch
+        self.cache_path = cache_path
+        self._cache: Dict[str, Tuple[str, str, bytes]] = _load_cache(cache_path) if cache_path else {}
+        
+        # Post URLs reported by earlier runs -> date they were recorded
+        self.seen_urls_path = seen_urls_path
+        self._seen: Dict[str, str] = _load_seen_urls(seen_urls_path) if seen_urls_path else {}
+        # Post URLs returned by this run, merged into _seen by commit_seen() so
+        # the current run never filters against itself
+        self._new_seen: Set[str] = set()
+        
+        # Per-host locks for the threaded path, and last request times per host
+        self._host_locks: Dict[str, threading.Lock] = {}
+        self._host_locks_guard = threading.Lock()
+        self._last_request: Dict[str, float] = {}
+        
         self.session = requests.Session()
         self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
+            'Accept-Encoding': ACCEPT_ENCODING
         })
         
-        # AI Companies and News Sources
+        # Pooled keep-alive connections, retrying rate limits and server errors
+        adapter = HTTPAdapter(
+            pool_connections=16,
+            pool_maxsize=16,
+            max_retries=_capped_retry_class()(
+                total=MAX_RETRIES,
+                backoff_factor=0.5,
+                status_forcelist=sorted(RETRY_STATUSES),
+                raise_on_status=False
+            )
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        
+        # AI Companies and News Sources. Sites with a 'feed_url' are read from
+        # their RSS/Atom feed, with 'url' as the HTML fallback
         self.companies = {
             # Major AI Companies
             'Anthropic': {
@@ -61,22 +210,27 @@ class BlogScraper:
             # Tech News Sources
             'TechCrunch AI': {
                 'url': 'https://techcrunch.com/category/artificial-intelligence/',
+                'feed_url': 'https://techcrunch.com/category/artificial-intelligence/feed/',
                 'parser': self._parse_generic_blog
             },
             'VentureBeat AI': {
                 'url': 'https://venturebeat.com/ai/',
+                'feed_url': 'https://venturebeat.com/category/ai/feed/',
                 'parser': self._parse_generic_blog
             },
             'The Verge AI': {
                 'url': 'https://www.theverge.com/ai-artificial-intelligence',
+                'feed_url': 'https://www.theverge.com/rss/ai-artificial-intelligence/index.xml',
                 'parser': self._parse_generic_blog
             },
             'Ars Technica AI': {
                 'url': 'https://arstechnica.com/tag/artificial-intelligence/',
+                'feed_url': 'https://arstechnica.com/tag/artificial-intelligence/feed/',
                 'parser': self._parse_generic_blog
             },
             'MIT Technology Review': {
                 'url': 'https://www.technologyreview.com/topic/artificial-intelligence/',
+                'feed_url': 'https://www.technologyreview.com/topic/artificial-intelligence/feed',
                 'parser': self._parse_generic_blog
             }
         }
@@ -90,28 +244,234 @@ class BlogScraper:
         Returns:
             Dictionary with company names as keys and list of posts as values
         """
+        if HAS_AIOHTTP:
+            return asyncio.run(self.scrape_all_companies_async(days_back))
+        
         results = {}
         cutoff_date = datetime.now() - timedelta(days=days_back)
         
-        for company_name, config in self.companies.items():
-            logger.info(f"Scraping {company_name}...")
-            try:
-                posts = self._scrape_company_blog(
-                    company_name, 
-                    config['url'], 
-                    config['parser'],
+        # requests releases the GIL while waiting on sockets, so threads overlap
+        # the fetches; _make_request keeps each host rate limited
+        with ThreadPoolExecutor(max_workers=max(len(self.companies), 1)) as executor:
+            futures = {}
+            for company_name, config in self.companies.items():
+                logger.info(f"Scraping {company_name}...")
+                url, parser_func = self._resolve_source(config)
+                future = executor.submit(
+                    self._scrape_company_blog,
+                    company_name,
+                    url,
+                    parser_func,
                     cutoff_date
                 )
-                results[company_name] = posts
-                logger.info(f"Found {len(posts)} recent posts from {company_name}")
+                futures[future] = company_name
+            
+            for future in as_completed(futures):
+                company_name = futures[future]
+                try:
+                    posts = future.result() or []
+                    results[company_name] = posts
+                    logger.info(f"Found {len(posts)} recent posts from {company_name}")
+                except Exception as e:
+                    logger.error(f"Failed to scrape {company_name}: {str(e)}")
+                    results[company_name] = []
+        
+        self._save_cache()
+        
+        # Keep the configured company order
+        return {company_name: results[company_name] for company_name in self.companies}
+
+    async def scrape_all_companies_async(self, days_back: int = 7) -> Dict[str, List[Dict]]:
+        """Scrape all configured company blogs concurrently
+        
+        Args:
+            days_back: How many days back to look for posts
+            
+        Returns:
+            Dictionary with company names as keys and list of posts as values
+        """
+        import aiohttp
+        
+        cutoff_date = datetime.now() - timedelta(days=days_back)
+        
+        sources = {company_name: self._resolve_source(config) for company_name, config in self.companies.items()}
+        
+        # One lock per host so sites sharing a domain are still rate limited
+        host_locks = {}
+        for url, _ in sources.values():
+            host_locks.setdefault(urlparse(url).netloc, asyncio.Semaphore(1))
+        
+        # Caps in-flight requests across all hosts
+        fetch_limit = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+        
+        connector = aiohttp.TCPConnector(limit_per_host=2, limit=64)
+        timeout = aiohttp.ClientTimeout(total=10)
+        
+        # Parsing is CPU-bound, so it runs off the event loop in worker
+        # processes that can parse several pages in parallel. Workers get this
+        # run's seen URLs up front rather than with every page. They start on
+        # first use, after aiohttp's threads exist, so spawn rather than fork
+        workers = max(min(os.cpu_count() or 1, len(sources)), 1)
+        with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context('spawn'),
+                                 initializer=_init_parse_worker, initargs=(self._seen,)) as parse_pool:
+            async with aiohttp.ClientSession(connector=connector, timeout=timeout,
+                                             headers=dict(self.session.headers)) as session:
+                all_posts = await asyncio.gather(*[
+                    self._fetch_and_parse(
+                        session,
+                        fetch_limit,
+                        host_locks[urlparse(url).netloc],
+                        parse_pool,
+                        company_name,
+                        url,
+                        parser_func,
+                        cutoff_date
+                    )
+                    for company_name, (url, parser_func) in sources.items()
+                ])
+        
+        self._save_cache()
+        return dict(zip(self.companies, all_posts))
+
+    def _resolve_source(self, config: Dict) -> Tuple[str, Callable]:
+        """Pick the URL and parser to scrape a configured company with
+        
+        Args:
+            config: Company config from self.companies
+            
+        Returns:
+            Tuple of (URL, parser function), preferring the RSS/Atom feed
+        """
+        if config.get('feed_url') and HAS_FEEDPARSER:
+            return config['feed_url'], self._parse_rss
+        return config['url'], config['parser']
+
+    async def _fetch_and_parse(self, session, fetch_limit: asyncio.Semaphore, host_lock: asyncio.Semaphore,
+                               parse_pool: Executor, company_name: str, url: str, parser_func, cutoff_date: datetime) -> List[Dict]:
+        """Fetch and parse a single company's blog
+        
+        Args:
+            session: Shared aiohttp session
+            fetch_limit: Semaphore capping concurrent requests
+            host_lock: Semaphore serializing requests to this blog's host
+            parse_pool: Process pool the built-in parsers run in
+            company_name: Name of the company
+            url: Blog URL to scrape
+            parser_func: Function to parse the specific blog format
+            cutoff_date: Only include posts newer than this date
+            
+        Returns:
+            List of post dictionaries
+        """
+        logger.info(f"Scraping {company_name}...")
+        try:
+            # Rate limiting, per host instead of across all sites: only wait if
+            # this host was requested less than rate_limit_delay ago
+            host = urlparse(url).netloc
+            async with host_lock:
+                wait = self._last_request.get(host, 0.0) + self.rate_limit_delay - time.monotonic()
+                if wait > 0:
+                    await asyncio.sleep(wait)
+                try:
+                    content = await self._fetch(session, url, fetch_limit)
+                finally:
+                    self._last_request[host] = time.monotonic()
+            
+            if not content:
+                return []
+            
+            loop = asyncio.get_running_loop()
+            if self._is_builtin_parser(parser_func):
+                posts = await loop.run_in_executor(parse_pool, _parse_worker, parser_func.__name__,
+                                                   content, url, cutoff_date)
+            else:
+                # Workers only have a plain BlogScraper, so custom parsers and
+                # subclass overrides run here, on the default thread pool
+                posts = await loop.run_in_executor(None, parser_func, content, url, cutoff_date)
+            self._mark_seen(posts, url)
+            logger.info(f"Found {len(posts)} recent posts from {company_name}")
+            return posts
+            
+        except Exception as e:
+            logger.error(f"Failed to scrape {company_name}: {str(e)}")
+            return []
+
+    def _is_builtin_parser(self, parser_func) -> bool:
+        """Check whether a parser can run in a parse worker process
+        
+        Workers parse with a plain BlogScraper, so only this class's own
+        parsers, bound to an unsubclassed scraper, give the same result there.
+        
+        Args:
+            parser_func: Parser configured for a company
+            
+        Returns:
+            True if _parse_worker can run the parser by name
+        """
+        name = getattr(parser_func, '__name__', None)
+        return (
+            type(self) is BlogScraper
+            and getattr(parser_func, '__self__', None) is self
+            and name in PARSE_WORKER_PARSERS
+            and getattr(parser_func, '__func__', None) is getattr(BlogScraper, name)
+        )
+
+    async def _fetch(self, session, url: str, fetch_limit: asyncio.Semaphore) -> Optional[bytes]:
+        """Make async HTTP request with retries and error handling
+        
+        Rate limited and server error responses are retried with exponential
+        backoff, or after the server's Retry-After delay when it sends one.
+        Callers hold the host lock, so that wait also throttles the host.
+        
+        Args:
+            session: aiohttp session to request with
+            url: URL to request
+            fetch_limit: Semaphore capping concurrent requests
+            
+        Returns:
+            Response body or None if failed
+        """
+        import aiohttp
+        
+        for attempt in range(MAX_RETRIES + 1):
+            retry_after = None
+            try:
+                async with fetch_limit:
+                    async with session.get(url, headers=self._conditional_headers(url)) as response:
+                        if response.status == 304 and url in self._cache:
+                            # Unchanged since the last run, reuse the cached body
+                            return self._cache[url][2]
+                        if response.status in RETRY_STATUSES and attempt < MAX_RETRIES:
+                            logger.warning(f"HTTP error {response.status} accessing {url}, retrying")
+                            retry_after = _parse_retry_after(response.headers.get('Retry-After'))
+                        else:
+                            response.raise_for_status()
+                            _warn_if_oversized(url, response.content_length)
+                            body = bytearray()
+                            async for chunk in response.content.iter_chunked(65536):
+                                body += chunk
+                                if len(body) >= MAX_RESPONSE_BYTES:
+                                    break
+                            body = bytes(body[:MAX_RESPONSE_BYTES])
+                            self._update_cache(url, response.headers, body)
+                            return body
+            except aiohttp.ClientResponseError as e:
+                logger.error(f"HTTP error {e.status} accessing {url}")
+                return None
+            except (asyncio.TimeoutError, aiohttp.ClientError) as e:
+                kind = "Timeout" if isinstance(e, asyncio.TimeoutError) else "Connection error"
+                if attempt == MAX_RETRIES:
+                    logger.error(f"{kind} accessing {url}")
+                    return None
+                logger.warning(f"{kind} accessing {url}, retrying")
             except Exception as e:
-                logger.error(f"Failed to scrape {company_name}: {str(e)}")
-                results[company_name] = []
+                logger.error(f"Unexpected error accessing {url}: {str(e)}")
+                return None
             
-            # Rate limiting
-            time.sleep(self.rate_limit_delay)
+            # Exponential backoff with jitter to avoid retry storms
+            await asyncio.sleep(retry_after if retry_after is not None else 2 ** attempt + random.random())
         
-        return results
+        return None
 
     def _scrape_company_blog(self, company_name: str, url: str, parser_func, cutoff_date: datetime) -> List[Dict]:
         """Scrape a single company's blog
@@ -125,12 +485,15 @@ class BlogScraper:
         Returns:
             List of post dictionaries
         """
+        import requests
+        
         try:
             response = self._make_request(url)
             if not response:
                 return []
             
             posts = parser_func(response.content, url, cutoff_date)
+            self._mark_seen(posts, url)
             return posts
             
         except requests.RequestException as e:
@@ -140,7 +503,7 @@ class BlogScraper:
             logger.error(f"Parsing error for {company_name}: {str(e)}")
             return []
 
-    def _make_request(self, url: str) -> Optional[requests.Response]:
+    def _make_request(self, url: str) -> Optional['requests.Response']:
         """Make HTTP request with error handling
         
         Args:
@@ -149,9 +512,28 @@ class BlogScraper:
         Returns:
             Response object or None if failed
         """
+        import requests
+        
         try:
-            response = self.session.get(url, timeout=10)
-            response.raise_for_status()
+            with self._host_rate_limit(url):
+                response = self.session.get(url, timeout=10, stream=True, headers=self._conditional_headers(url))
+            with response:
+                if response.status_code == 304 and url in self._cache:
+                    # Unchanged since the last run, reuse the cached body
+                    response._content = self._cache[url][2]
+                    return response
+                response.raise_for_status()
+                
+                # Read at most MAX_RESPONSE_BYTES of the streamed body
+                _warn_if_oversized(url, response.headers.get('Content-Length'))
+                body = bytearray()
+                for chunk in response.iter_content(chunk_size=65536):
+                    body += chunk
+                    if len(body) >= MAX_RESPONSE_BYTES:
+                        break
+                response._content = bytes(body[:MAX_RESPONSE_BYTES])
+            
+            self._update_cache(url, response.headers, response.content)
             return response
         except requests.exceptions.Timeout:
             logger.error(f"Timeout accessing {url}")
@@ -166,52 +548,248 @@ class BlogScraper:
             logger.error(f"Unexpected error accessing {url}: {str(e)}")
             return None
 
+    def _conditional_headers(self, url: str) -> Dict[str, str]:
+        """Build conditional GET headers from a URL's cached validators
+        
+        Args:
+            url: URL about to be requested
+            
+        Returns:
+            If-None-Match/If-Modified-Since headers, empty if URL isn't cached
+        """
+        headers = {}
+        if url in self._cache:
+            etag, last_modified, _ = self._cache[url]
+            if etag:
+                headers['If-None-Match'] = etag
+            if last_modified:
+                headers['If-Modified-Since'] = last_modified
+        return headers
+
+    def _update_cache(self, url: str, headers, body: bytes):
+        """Remember a response's validators and body for conditional requests
+        
+        Args:
+            url: URL that was requested
+            headers: Response headers
+            body: Response body
+        """
+        if self.cache_path is None:
+            return
+        etag = headers.get('ETag', '')
+        last_modified = headers.get('Last-Modified', '')
+        if etag or last_modified:
+            self._cache[url] = (etag, last_modified, body)
+        else:
+            self._cache.pop(url, None)
+
+    def _save_cache(self):
+        """Persist the conditional request cache to cache_path"""
+        if self.cache_path is None:
+            return
+        data = {
+            url: {
+                'etag': etag,
+                'last_modified': last_modified,
+                'body': base64.b64encode(body).decode('ascii')
+            }
+            for url, (etag, last_modified, body) in self._cache.items()
+        }
+        try:
+            _write_json(self.cache_path, data)
+        except OSError as e:
+            logger.warning(f"Could not save scrape cache to {self.cache_path}: {str(e)}")
+
+    def _mark_seen(self, posts: List[Dict], page_url: str):
+        """Record returned posts so later runs skip them
+        
+        Args:
+            posts: Posts returned for a page
+            page_url: URL of the page, used as the link of posts without one
+        """
+        if self.seen_urls_path is None:
+            return
+        for post in posts:
+            # Custom parsers may return posts without a URL
+            link = post.get('url')
+            if link and link != page_url:
+                self._new_seen.add(link)
+
+    def commit_seen(self):
+        """Record the posts returned so far as reported and persist them
+        
+        Call this once the posts have been delivered (e.g. the report was
+        written), so a failure before then doesn't hide them from later runs.
+        Entries older than SEEN_URL_MAX_AGE_DAYS are dropped.
+        """
+        if self.seen_urls_path is None:
+            return
+        today = datetime.now().date().isoformat()
+        self._seen.update(dict.fromkeys(self._new_seen, today))
+        self._new_seen.clear()
+        self._seen = _drop_expired_seen(self._seen)
+        try:
+            _write_json(self.seen_urls_path, self._seen)
+        except OSError as e:
+            logger.warning(f"Could not save seen URLs to {self.seen_urls_path}: {str(e)}")
+
+    @contextmanager
+    def _host_rate_limit(self, url: str):
+        """Serialize requests to a host, spacing them rate_limit_delay apart
+        
+        Args:
+            url: URL about to be requested
+        """
+        host = urlparse(url).netloc
+        with self._host_locks_guard:
+            lock = self._host_locks.setdefault(host, threading.Lock())
+        
+        with lock:
+            wait = self._last_request.get(host, 0.0) + self.rate_limit_delay - time.monotonic()
+            if wait > 0:
+                time.sleep(wait)
+            try:
+                yield
+            finally:
+                self._last_request[host] = time.monotonic()
+
+    def _parse_rss(self, feed_content: bytes, feed_url: str, cutoff_date: datetime) -> List[Dict]:
+        """Parser for RSS/Atom feeds"""
+        posts = []
+        try:
+            import feedparser
+            
+            feed = feedparser.parse(feed_content)
+            company = urlparse(feed_url).netloc.replace('www.', '').title()
+            
+            for entry in feed.entries[:15]:  # Limit to prevent overwhelming
+                link = entry.get('link') or feed_url
+                if link in self._seen:
+                    # Already reported by an earlier run
+                    continue
+                
+                title = _WS_RE.sub(' ', entry.get('title', '')).strip()
+                if not title:
+                    continue
+                
+                # feedparser normalizes RFC 822/ISO timestamps to UTC struct_time;
+                # compare in local time like the HTML path
+                timestamp = entry.get('published_parsed') or entry.get('updated_parsed')
+                if timestamp:
+                    post_date = _to_local_naive(datetime(*timestamp[:6], tzinfo=timezone.utc))
+                else:
+                    post_date = None
+                
+                # Feed summaries are often HTML fragments
+                summary = html.unescape(_TAG_RE.sub(' ', entry.get('summary', '')))
+                summary = _WS_RE.sub(' ', summary).strip()
+                
+                post = {
+                    'title': title,
+                    'url': link,
+                    'date': post_date,
+                    'summary': summary[:200] + "..." if summary else "No summary available",
+                    'company': company,
+                    'scraped_at': datetime.now().isoformat()
+                }
+                if self._is_recent_post(post_date, cutoff_date):
+                    posts.append(post)
+                    
+        except Exception as e:
+            logger.error(f"Error parsing feed: {str(e)}")
+            
+        return posts
+
     def _parse_generic_blog(self, html_content: bytes, base_url: str, cutoff_date: datetime) -> List[Dict]:
         """Generic parser for most news/blog websites"""
+        if LexborHTMLParser is not None:
+            return self._parse_generic_blog_lexbor(html_content, base_url, cutoff_date)
+        
         posts = []
         try:
-            soup = BeautifulSoup(html_content, 'html.parser')
-            company = urlparse(base_url).netloc.replace('www.', '').title()
-            
-            # Multiple selector strategies for different site structures
-            selectors = [
-                'article',
-                '[class*="post"]',
-                '[class*="article"]',
-                '[class*="story"]',
-                '[class*="entry"]',
-                '[class*="item"]',
-                '[class*="card"]'
-            ]
+            from bs4 import BeautifulSoup, SoupStrainer
+            
+            soup = BeautifulSoup(html_content, HTML_PARSER, parse_only=SoupStrainer(STRAINER_TAGS))
+            parsed_url = urlparse(base_url)
+            origin = f"{parsed_url.scheme}://{parsed_url.netloc}"
+            company = parsed_url.netloc.replace('www.', '').title()
             
+            # One union selector walks the tree once instead of once per strategy
+            post_elements = soup.select(POST_SELECTOR)
+            
+            # Fallback: look for any elements with headlines
+            if not post_elements:
+                post_elements = soup.find_all(['div'], string=_NON_EMPTY_RE)[:10]
+            
+            # The union also matches pieces of posts (titles, meta, excerpts),
+            # so the limit counts distinct posts rather than matched elements
+            seen_titles = set()
+            for element in post_elements:
+                post = self._extract_post_info(element, base_url, origin, company)
+                if post and post.get('title') and len(post['title']) > 10:  # Filter out noise
+                    # Nested containers often yield the same post twice
+                    if post['title'] in seen_titles:
+                        continue
+                    seen_titles.add(post['title'])
+                    if self._is_recent_post(post.get('date'), cutoff_date):
+                        posts.append(post)
+                    if len(seen_titles) >= 15:  # Limit to prevent overwhelming
+                        break
+                        
+        except Exception as e:
+            logger.error(f"Error parsing generic blog: {str(e)}")
+            
+        return posts
+
+    def _parse_generic_blog_lexbor(self, html_content: bytes, base_url: str, cutoff_date: datetime) -> List[Dict]:
+        """Generic parser backed by selectolax's Lexbor engine"""
+        posts = []
+        try:
+            tree = LexborHTMLParser(html_content)
+            parsed_url = urlparse(base_url)
+            origin = f"{parsed_url.scheme}://{parsed_url.netloc}"
+            company = parsed_url.netloc.replace('www.', '').title()
+            
+            # Lexbor repeats a node once per matching selector, so dedupe
+            # while keeping document order
             post_elements = []
-            for selector in selectors:
-                elements = soup.select(selector)
-                if elements:
-                    post_elements = elements[:15]  # Limit to prevent overwhelming
-                    break
+            seen_nodes = set()
+            for element in tree.css(POST_SELECTOR):
+                if element.mem_id not in seen_nodes:
+                    seen_nodes.add(element.mem_id)
+                    post_elements.append(element)
             
             # Fallback: look for any elements with headlines
             if not post_elements:
-                post_elements = soup.find_all(['div'], string=re.compile(r'.+'))[:10]
+                post_elements = [div for div in tree.css('div') if div.text(deep=False).strip()][:10]
             
+            # The union also matches pieces of posts (titles, meta, excerpts),
+            # so the limit counts distinct posts rather than matched nodes
+            seen_titles = set()
             for element in post_elements:
-                post = self._extract_post_info(element, base_url, company)
+                post = self._extract_post_info_lexbor(element, base_url, origin, company)
                 if post and post.get('title') and len(post['title']) > 10:  # Filter out noise
+                    # Nested containers often yield the same post twice
+                    if post['title'] in seen_titles:
+                        continue
+                    seen_titles.add(post['title'])
                     if self._is_recent_post(post.get('date'), cutoff_date):
                         posts.append(post)
+                    if len(seen_titles) >= 15:  # Limit to prevent overwhelming
+                        break
                         
         except Exception as e:
             logger.error(f"Error parsing generic blog: {str(e)}")
             
         return posts
 
-    def _extract_post_info(self, element, base_url: str, company: str) -> Optional[Dict]:
+    def _extract_post_info(self, element, base_url: str, origin: str, company: str) -> Optional[Dict]:
         """Extract post information from HTML element
         
         Args:
             element: BeautifulSoup element containing post info
             base_url: Base URL for resolving relative links
+            origin: Scheme and host of base_url, for root-relative links
             company: Company name
             
         Returns:
@@ -227,18 +805,26 @@ class BlogScraper:
                 '[class*="headline"]'
             ]
             
+            # Extract each candidate's text once and keep it
+            title = ""
             for selectors in title_selectors:
                 if isinstance(selectors, list):
-                    title_elem = element.find(selectors)
+                    candidate = element.find(selectors)
                 else:
-                    title_elem = element.select_one(selectors)
-                if title_elem and title_elem.get_text().strip():
-                    break
+                    candidate = element.select_one(selectors)
+                if candidate:
+                    text = candidate.get_text().strip()
+                    if text:
+                        title_elem, title = candidate, text
+                        break
             
-            title = title_elem.get_text().strip() if title_elem else "No title found"
+            # Union selection also matches fragments like excerpts; without a
+            # headline the element isn't a post
+            if not title_elem:
+                return None
             
             # Clean up title (remove extra whitespace, newlines)
-            title = re.sub(r'\s+', ' ', title).strip()
+            title = _WS_RE.sub(' ', title)
             
             # Try to find link - prefer title links, then any link
             link_elem = None
@@ -248,20 +834,24 @@ class BlogScraper:
                 link_elem = element.find('a', href=True)
             
             if link_elem and link_elem.get('href'):
-                link = urljoin(base_url, link_elem['href'])
+                link = _resolve_link(link_elem['href'], base_url, origin)
             else:
                 link = base_url
             
+            # Already reported by an earlier run
+            if link in self._seen:
+                return None
+            
             # Try to find date
-            date_elem = element.find(['time', 'span', 'div'], class_=re.compile(r'date|time|published', re.I))
+            date_elem = element.select_one(DATE_SELECTOR)
             if date_elem:
                 date_text = date_elem.get('datetime') or date_elem.get_text().strip()
-                post_date = self._parse_date(date_text)
+                post_date = _parse_date(date_text)
             else:
                 post_date = None
             
             # Try to find summary/excerpt
-            summary_elem = element.find(['p', 'div'], class_=re.compile(r'summary|excerpt|description', re.I))
+            summary_elem = element.select_one(SUMMARY_SELECTOR)
             if not summary_elem:
                 # Fallback to first paragraph
                 summary_elem = element.find('p')
@@ -281,41 +871,87 @@ class BlogScraper:
             logger.debug(f"Failed to extract post info: {str(e)}")
             return None
 
-    def _parse_date(self, date_text: str) -> Optional[datetime]:
-        """Parse date from various formats
+    def _extract_post_info_lexbor(self, element, base_url: str, origin: str, company: str) -> Optional[Dict]:
+        """Extract post information from a Lexbor node
         
         Args:
-            date_text: Date string to parse
+            element: selectolax node containing post info
+            base_url: Base URL for resolving relative links
+            origin: Scheme and host of base_url, for root-relative links
+            company: Company name
             
         Returns:
-            Datetime object or None if parsing failed
+            Dictionary with post info or None if extraction failed
         """
-        if not date_text:
-            return None
+        try:
+            # Try to find title with multiple strategies
+            title_elem = None
+            title_selectors = [
+                'h1, h2, h3, h4',
+                'a',
+                '[class*="title"]',
+                '[class*="headline"]'
+            ]
             
-        date_text = date_text.strip()
-        
-        # Common date formats
-        date_formats = [
-            '%Y-%m-%d',
-            '%Y-%m-%dT%H:%M:%S',
-            '%Y-%m-%dT%H:%M:%SZ',
-            '%B %d, %Y',
-            '%b %d, %Y',
-            '%d %B %Y',
-            '%d %b %Y',
-            '%m/%d/%Y',
-            '%d/%m/%Y'
-        ]
-        
-        for fmt in date_formats:
-            try:
-                return datetime.strptime(date_text, fmt)
-            except ValueError:
-                continue
-        
-        logger.debug(f"Could not parse date: {date_text}")
-        return None
+            # Extract each candidate's text once and keep it
+            title = ""
+            for selector in title_selectors:
+                candidate = element.css_first(selector)
+                if candidate:
+                    text = candidate.text().strip()
+                    if text:
+                        title_elem, title = candidate, text
+                        break
+            
+            # Union selection also matches fragments like excerpts; without a
+            # headline the node isn't a post
+            if not title_elem:
+                return None
+            
+            # Clean up title (remove extra whitespace, newlines)
+            title = _WS_RE.sub(' ', title)
+            
+            # Try to find link - prefer title links, then any link
+            if title_elem and title_elem.tag == 'a':
+                link_elem = title_elem
+            else:
+                link_elem = element.css_first('a[href]')
+            
+            href = link_elem.attributes.get('href') if link_elem else None
+            link = _resolve_link(href, base_url, origin) if href else base_url
+            
+            # Already reported by an earlier run
+            if link in self._seen:
+                return None
+            
+            # Try to find date
+            date_elem = element.css_first(DATE_SELECTOR)
+            if date_elem:
+                date_text = date_elem.attributes.get('datetime') or date_elem.text().strip()
+                post_date = _parse_date(date_text)
+            else:
+                post_date = None
+            
+            # Try to find summary/excerpt
+            summary_elem = element.css_first(SUMMARY_SELECTOR)
+            if not summary_elem:
+                # Fallback to first paragraph
+                summary_elem = element.css_first('p')
+            
+            summary = summary_elem.text().strip()[:200] + "..." if summary_elem else "No summary available"
+            
+            return {
+                'title': title,
+                'url': link,
+                'date': post_date,
+                'summary': summary,
+                'company': company,
+                'scraped_at': datetime.now().isoformat()
+            }
+            
+        except Exception as e:
+            logger.debug(f"Failed to extract post info: {str(e)}")
+            return None
 
     def _is_recent_post(self, post_date: Optional[datetime], cutoff_date: datetime) -> bool:
         """Check if post is recent enough
@@ -331,6 +967,232 @@ class BlogScraper:
             return True  # Include posts without dates
         return post_date >= cutoff_date
 
+# Scraper used to parse pages inside a parse worker process. It skips __init__,
+# so workers never import requests or build a session; the parsers only read _seen.
+_worker_scraper: Optional[BlogScraper] = None
+
+def _init_parse_worker(seen_urls: Dict[str, str]):
+    """Set up a parse worker process
+    
+    Args:
+        seen_urls: Post URLs reported by earlier runs, to skip while parsing
+    """
+    global _worker_scraper
+    _worker_scraper = BlogScraper.__new__(BlogScraper)
+    _worker_scraper._seen = seen_urls
+
+def _parse_worker(parser_name: str, content: bytes, url: str, cutoff_date: datetime) -> List[Dict]:
+    """Parse a fetched page in a worker process
+    
+    Module-level so it can be pickled for ProcessPoolExecutor.
+    
+    Args:
+        parser_name: Name of the BlogScraper parser method to use
+        content: Page or feed body
+        url: URL the content was fetched from
+        cutoff_date: Only include posts newer than this date
+        
+    Returns:
+        List of post dictionaries
+    """
+    return getattr(_worker_scraper, parser_name)(content, url, cutoff_date)
+
+@functools.lru_cache(maxsize=4096)
+def _parse_date(date_text: str) -> Optional[datetime]:
+    """Parse date from various formats
+    
+    Cached since pages tend to repeat the same date string across posts.
+    Datetimes are immutable, so sharing results is safe.
+    
+    Args:
+        date_text: Date string to parse
+        
+    Returns:
+        Datetime object or None if parsing failed
+    """
+    from dateutil import parser as dateutil_parser
+    
+    if not date_text:
+        return None
+        
+    date_text = date_text.strip()
+    
+    # Most <time datetime="..."> values are ISO 8601, which ciso8601 parses in C
+    if ciso8601 is not None:
+        try:
+            return _to_local_naive(ciso8601.parse_datetime(date_text))
+        except ValueError:
+            pass
+    
+    # Human formats like "March 5, 2024" or "05 Mar 2024". Fuzzy parsing also
+    # turns text like "5 min read" into a date, so parse against two sentinel
+    # defaults and reject results whose year or month came from the default
+    try:
+        parsed = dateutil_parser.parse(date_text, fuzzy=True, default=_DATE_SENTINELS[0])
+        check = dateutil_parser.parse(date_text, fuzzy=True, default=_DATE_SENTINELS[1])
+        if (parsed.year, parsed.month) == (check.year, check.month):
+            return _to_local_naive(parsed)
+    except (ValueError, OverflowError):
+        pass
+    
+    logger.debug(f"Could not parse date: {date_text}")
+    return None
+
+def _to_local_naive(value: datetime) -> datetime:
+    """Convert a timezone-aware datetime to naive local time
+    
+    Cutoff dates are naive local times, so parsed dates must match to be
+    comparable. Naive datetimes are returned unchanged.
+    
+    Args:
+        value: Datetime to convert
+        
+    Returns:
+        Naive datetime in local time
+    """
+    if value.tzinfo is None:
+        return value
+    return value.astimezone().replace(tzinfo=None)
+
+def _resolve_link(href: str, base_url: str, origin: str) -> str:
+    """Resolve a post link against the page it was found on
+    
+    Absolute and root-relative hrefs cover nearly every post link, so they
+    skip urljoin re-parsing base_url for each element.
+    
+    Args:
+        href: Link as written in the page
+        base_url: URL of the page
+        origin: Scheme and host of base_url
+        
+    Returns:
+        Absolute URL
+    """
+    if href.startswith(('http://', 'https://')):
+        return href
+    if href.startswith('/') and not href.startswith('//'):
+        return origin + href
+    return urljoin(base_url, href)
+
+def _warn_if_oversized(url: str, content_length) -> None:
+    """Log when a response is larger than MAX_RESPONSE_BYTES
+    
+    Args:
+        url: URL that was requested
+        content_length: Content-Length of the response, if known
+    """
+    try:
+        size = int(content_length) if content_length is not None else 0
+    except ValueError:
+        return
+    if size > MAX_RESPONSE_BYTES:
+        logger.warning(f"{url} is {size} bytes, only reading the first {MAX_RESPONSE_BYTES}")
+
+def _load_cache(path: str) -> Dict[str, Tuple[str, str, bytes]]:
+    """Load the conditional request cache written by BlogScraper._save_cache
+    
+    Args:
+        path: Cache file path
+        
+    Returns:
+        Mapping of URL to (ETag, Last-Modified, body), empty if unreadable
+    """
+    if not os.path.exists(path):
+        return {}
+    try:
+        data = _read_json(path)
+        return {
+            url: (entry['etag'], entry['last_modified'], base64.b64decode(entry['body']))
+            for url, entry in data.items()
+        }
+    except (OSError, ValueError, KeyError, TypeError) as e:
+        logger.warning(f"Ignoring unreadable scrape cache {path}: {str(e)}")
+        return {}
+
+def _load_seen_urls(path: str) -> Dict[str, str]:
+    """Load the seen post URLs written by BlogScraper.commit_seen
+    
+    Args:
+        path: Seen URLs file path
+        
+    Returns:
+        Mapping of post URL to the ISO date it was recorded, without expired
+        entries, empty if unreadable
+    """
+    if not os.path.exists(path):
+        return {}
+    try:
+        data = _read_json(path)
+        return _drop_expired_seen({str(url): str(recorded) for url, recorded in data.items()})
+    except (OSError, ValueError, TypeError, AttributeError) as e:
+        logger.warning(f"Ignoring unreadable seen URLs file {path}: {str(e)}")
+        return {}
+
+def _drop_expired_seen(seen: Dict[str, str]) -> Dict[str, str]:
+    """Drop seen URLs recorded more than SEEN_URL_MAX_AGE_DAYS ago
+    
+    Args:
+        seen: Mapping of post URL to the ISO date it was recorded
+        
+    Returns:
+        Mapping with only the unexpired entries
+    """
+    cutoff = (datetime.now().date() - timedelta(days=SEEN_URL_MAX_AGE_DAYS)).isoformat()
+    return {url: recorded for url, recorded in seen.items() if recorded >= cutoff}
+
+def _read_json(path: str) -> Any:
+    """Read a JSON file, with orjson when available"""
+    with open(path, 'rb') as f:
+        raw = f.read()
+    return orjson.loads(raw) if orjson is not None else json.loads(raw)
+
+def _write_json(path: str, data: Any):
+    """Atomically write data to a JSON file, with orjson when available"""
+    payload = orjson.dumps(data) if orjson is not None else json.dumps(data).encode('utf-8')
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(payload)
+    os.replace(tmp_path, path)
+
+@functools.lru_cache(maxsize=None)
+def _capped_retry_class() -> type:
+    """Build a urllib3 Retry that caps Retry-After waits like the async path
+    
+    urllib3 sleeps for whatever Retry-After a server sends, so a 429 asking
+    for an hour would block the request (and its host lock) for an hour.
+    Built on first use so urllib3 is only imported along with requests.
+    
+    Returns:
+        Retry subclass whose waits are capped at MAX_RETRY_AFTER
+    """
+    from urllib3.util.retry import Retry
+    
+    class CappedRetry(Retry):
+        def get_retry_after(self, response) -> Optional[float]:
+            return _parse_retry_after(response.headers.get('Retry-After'))
+    
+    return CappedRetry
+
+def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header into seconds to wait
+    
+    Args:
+        value: Header value, either delay seconds or an HTTP date
+        
+    Returns:
+        Seconds to wait (capped at MAX_RETRY_AFTER) or None if absent/invalid
+    """
+    if not value:
+        return None
+    try:
+        delay = float(value)
+    except ValueError:
+        try:
+            delay = (parsedate_to_datetime(value) - datetime.now(timezone.utc)).total_seconds()
+        except (TypeError, ValueError):
+            return None
+    return min(max(delay, 0.0), MAX_RETRY_AFTER)
+
 def main():
     """Main function to run the scraper"""
     scraper = BlogScraper()
@@ -353,6 +1215,9 @@ def main():
             print(f"    Summary: {post['summary'][:100]}...")
             print()
     
+    # Only skip these posts in later runs once they've been shown
+    scraper.commit_seen()
+    
     return results
 
 if __name__ == "__main__":